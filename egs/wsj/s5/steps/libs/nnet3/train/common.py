@@ -152,19 +152,19 @@ def copy_egs_properties_to_exp_dir(egs_dir, dir):
 def parse_generic_config_vars_file(var_file):
     variables = {}
     try:
-        var_file_handle = open(var_file, 'r')
-        for line in var_file_handle:
-            parts = line.split('=')
-            field_name = parts[0].strip()
-            field_value = parts[1].strip()
-            if field_name in ['model_left_context', 'left_context']:
-                variables['model_left_context'] = int(field_value)
-            elif field_name in ['model_right_context', 'right_context']:
-                variables['model_right_context'] = int(field_value)
-            elif field_name == 'num_hidden_layers':
-                variables['num_hidden_layers'] = int(field_value)
-            else:
-                variables[field_name] = field_value
+        with open(var_file, 'r') as var_file_handle:
+            for line in var_file_handle:
+                parts = line.split('=')
+                field_name = parts[0].strip()
+                field_value = parts[1].strip()
+                if field_name in ['model_left_context', 'left_context']:
+                    variables['model_left_context'] = int(field_value)
+                elif field_name in ['model_right_context', 'right_context']:
+                    variables['model_right_context'] = int(field_value)
+                elif field_name == 'num_hidden_layers':
+                    variables['num_hidden_layers'] = int(field_value)
+                else:
+                    variables[field_name] = field_value
         return variables
     except ValueError:
         # we will throw an error at the end of the function so I will just pass
@@ -173,17 +173,21 @@ def parse_generic_config_vars_file(var_file):
     raise Exception('Error while parsing the file {0}'.format(var_file))
 
 
+def _read_egs_info(egs_dir, name):
+    """ Reads the integer stored in the first line of {egs_dir}/info/{name}
+    and closes the file straight away.
+    """
+    with open('{0}/info/{1}'.format(egs_dir, name)) as f:
+        return int(f.readline())
+
+
 def verify_egs_dir(egs_dir, feat_dim, ivector_dim,
                    left_context, right_context):
     try:
-        egs_feat_dim = int(open('{0}/info/feat_dim'.format(
-                                    egs_dir)).readline())
-        egs_ivector_dim = int(open('{0}/info/ivector_dim'.format(
-                                    egs_dir)).readline())
-        egs_left_context = int(open('{0}/info/left_context'.format(
-                                    egs_dir)).readline())
-        egs_right_context = int(open('{0}/info/right_context'.format(
-                                    egs_dir)).readline())
+        egs_feat_dim = _read_egs_info(egs_dir, 'feat_dim')
+        egs_ivector_dim = _read_egs_info(egs_dir, 'ivector_dim')
+        egs_left_context = _read_egs_info(egs_dir, 'left_context')
+        egs_right_context = _read_egs_info(egs_dir, 'right_context')
         if (feat_dim != egs_feat_dim) or (ivector_dim != egs_ivector_dim):
             raise Exception("There is mismatch between featdim/ivector_dim of "
                             "the current experiment and the provided "
@@ -193,10 +197,8 @@ def verify_egs_dir(egs_dir, feat_dim, ivector_dim,
                 egs_right_context < right_context):
             raise Exception('The egs have insufficient context')
 
-        frames_per_eg = int(open('{0}/info/frames_per_eg'.format(
-                                    egs_dir)).readline())
-        num_archives = int(open('{0}/info/num_archives'.format(
-                                    egs_dir)).readline())
+        frames_per_eg = _read_egs_info(egs_dir, 'frames_per_eg')
+        num_archives = _read_egs_info(egs_dir, 'num_archives')
 
         return [egs_left_context, egs_right_context,
                 frames_per_eg, num_archives]
@@ -14,6 +14,7 @@ import logging
 import pprint
 import os
 import sys
+import threading
 import traceback
 
 sys.path.insert(0, 'steps')
@@ -183,11 +184,11 @@ def process_args(args):
             "--trainer.deriv-truncate-margin.".format(
                 args.deriv_truncate_margin))
 
-    if (not os.path.exists(args.dir)
-            or not os.path.exists(args.dir+"/configs")):
+    # a single stat is enough, as {dir}/configs can only exist inside {dir}
+    if not os.path.isdir("{0}/configs".format(args.dir)):
         raise Exception("This scripts expects {0} to exist and have a configs "
                         "directory which is the output of "
-                        "make_configs.py script")
+                        "make_configs.py script".format(args.dir))
 
     # set the options corresponding to args.use_gpu
     run_opts = common_train_lib.RunOpts()
@@ -224,6 +225,24 @@ def process_args(args):
     return [args, run_opts]
 
 
+def send_progress_report(dir, iter, email):
+    """ Generates the accuracy report from the logs in dir and mails it.
+
+    This is run in a separate thread by train(), as parsing the logs of all
+    the iterations so far can take a while. A failure to generate the report
+    is logged but does not stop the training.
+    """
+    try:
+        [report, times, data] = (
+            nnet3_log_parse.generate_acc_logprob_report(dir))
+    except Exception as e:
+        logger.warning("Could not generate the progress report for "
+                       "iteration {0}: {1}".format(iter, str(e)))
+        return
+    subject = "Update : Expt {dir} : Iter {iter}".format(dir=dir, iter=iter)
+    common_lib.send_mail(report, subject, email)
+
+
 def train(args, run_opts, background_process_handler):
     """ The main function for training.
 
@@ -233,8 +252,9 @@ def train(args, run_opts, background_process_handler):
         run_opts: RunOpts object obtained from the process_args()
     """
 
-    arg_string = pprint.pformat(vars(args))
-    logger.info("Arguments for the experiment\n{0}".format(arg_string))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Arguments for the experiment\n%s",
+                    pprint.pformat(vars(args)))
 
     # Set some variables.
     feat_dim = common_lib.get_feat_dim(args.feat_dir)
@@ -257,7 +277,7 @@ def train(args, run_opts, background_process_handler):
             variables['include_log_softmax'])
     except KeyError as e:
         raise Exception("KeyError {0}: Variables need to be defined in "
-                        "{1}".format(str(e), '{0}/configs'.format(args.dir)))
+                        "{1}".format(str(e), config_dir))
 
     left_context = args.chunk_left_context + model_left_context
     right_context = args.chunk_right_context + model_right_context
@@ -295,8 +315,7 @@ def train(args, run_opts, background_process_handler):
                 num_targets = int(variables['num_targets'])
             except KeyError as e:
                 raise Exception("KeyError {0}: Variables need to be defined "
-                                "in {1}".format(
-                                    str(e), '{0}/configs'.format(args.dir)))
+                                "in {1}".format(str(e), config_dir))
 
         train_lib.raw_model.generate_egs_using_targets(
             data=args.feat_dir, targets_scp=args.targets_scp,
@@ -377,9 +396,13 @@ def train(args, run_opts, background_process_handler):
         max_deriv_time = (args.chunk_width - 1 + args.deriv_truncate_margin
                           + model_right_context)
 
+    reporting_iter_interval = num_iters * args.reporting_interval
+
     logger.info("Training will run for {0} epochs = "
                 "{1} iterations".format(args.num_epochs, num_iters))
 
+    report_threads = []
+
     for iter in range(num_iters):
         if (args.exit_stage is not None) and (iter == args.exit_stage):
             logger.info("Exiting early due to --exit-stage {0}".format(iter))
@@ -440,15 +463,14 @@ def train(args, run_opts, background_process_handler):
                     get_raw_nnet_from_am=False)
 
             if args.email is not None:
-                reporting_iter_interval = num_iters * args.reporting_interval
                 if iter % reporting_iter_interval == 0:
-                    # lets do some reporting
-                    [report, times, data] = (
-                        nnet3_log_parse.generate_accuracy_report(args.dir))
-                    message = report
-                    subject = ("Update : Expt {dir} : "
-                               "Iter {iter}".format(dir=args.dir, iter=iter))
-                    common_lib.send_mail(message, subject, args.email)
+                    # lets do some reporting, without holding up the next
+                    # iteration
+                    report_thread = threading.Thread(
+                        target=send_progress_report,
+                        args=(args.dir, iter, args.email))
+                    report_thread.start()
+                    report_threads.append(report_thread)
 
         num_archives_processed = num_archives_processed + current_num_jobs
 
@@ -487,8 +509,14 @@ def train(args, run_opts, background_process_handler):
             remove_egs=remove_egs,
             get_raw_nnet_from_am=False)
 
+    # wait for the progress reports, so that they are sent before the final
+    # one
+    for report_thread in report_threads:
+        report_thread.join()
+
     # do some reporting
-    [report, times, data] = nnet3_log_parse.generate_accuracy_report(args.dir)
+    [report, times, data] = nnet3_log_parse.generate_acc_logprob_report(
+        args.dir)
     if args.email is not None:
         common_lib.send_mail(report, "Update : Expt {0} : "
                                      "complete".format(args.dir), args.email)